@@ -3,23 +3,50 @@ import os
 import platform
 import subprocess
 import threading
-import queue
-import glob
+import concurrent.futures
+import collections
 import json
 import shutil
+import functools
 import winreg
 import re
+import time
+import ctypes
+from ctypes import wintypes
 
 import customtkinter as ctk
 
 ###############################################################################
-# Log Queue and Logging Functions
+# Log Ring Buffer and Logging Functions
 ###############################################################################
-log_queue = queue.Queue()
+# Fixed-size ring buffer: appends are O(1) with no per-message allocation
+# churn, and a flood of output can never grow the pending backlog unboundedly.
+LOG_BUFFER_SIZE = 8192
+log_buffer = collections.deque(maxlen=LOG_BUFFER_SIZE)
+log_buffer_lock = threading.Lock()
+
+# Widget used to wake the GUI drain from worker threads (set by the app).
+_log_event_widget = None
+
+# The widget keeps a bounded scrollback; the full history goes to build.log.
+MAX_LOG_LINES = 5000
+try:
+    _log_file = open("build.log", "a", encoding="utf-8", errors="replace")
+except OSError:
+    _log_file = None
 
 def log(message: str):
-    """Sends a message to the queue, which will be processed by the GUI."""
-    log_queue.put(message)
+    """Appends a message to the ring buffer, which is drained by the GUI."""
+    with log_buffer_lock:
+        log_buffer.append(message)
+        if _log_file is not None:
+            _log_file.write(message + "\n")
+    widget = _log_event_widget
+    if widget is not None:
+        try:
+            widget.event_generate("<<LogAvailable>>", when="tail")
+        except Exception:
+            pass  # GUI being torn down; the fallback poll still drains.
 
 ###############################################################################
 # ANSI Parser for Coloring Output in CTkTextbox
@@ -35,17 +62,27 @@ ANSI_COLORS = {
     '37': "ansi_white",
 }
 
+_ANSI_RE = re.compile(r'(\x1b\[[0-9;]*m)')
+# Maps a code directly to its color tag ('0' resets to None); codes outside
+# the table (bold, underline, ...) leave the current color untouched.
+_ANSI_REDUCE = {'0': None, **ANSI_COLORS}
+_ANSI_IGNORED = object()
+
 def parse_ansi(text: str):
     """
     Extracts ANSI codes (e.g., \x1b[31m) and returns a list of (segment, color_tag).
     If there is no color, color_tag is None.
     """
+    # Most build-tool lines carry no escape codes at all; a C-level substring
+    # scan is far cheaper than running the regex over the whole text.
+    if '\x1b' not in text:
+        return [(text, None)]
+
     segments = []
     current_color = None
     last_pos = 0
-    pattern = re.compile(r'(\x1b\[[0-9;]*m)')
-    
-    for match in pattern.finditer(text):
+
+    for match in _ANSI_RE.finditer(text):
         esc_sequence = match.group(1)
         start, end = match.span()
         if start > last_pos:
@@ -54,13 +91,13 @@ def parse_ansi(text: str):
         # Process ANSI code
         code = esc_sequence[2:-1]  # remove "\x1b[" and "m"
         codes = code.split(';')
-        new_color = current_color
-        for c in codes:
-            if c == '0':
-                new_color = None
-            elif c in ANSI_COLORS:
-                new_color = ANSI_COLORS[c]
-        current_color = new_color
+        # Only the last recognised code decides the color; one C-level dict
+        # lookup per code replaces the interpreted if/elif chain.
+        for c in reversed(codes):
+            mapped = _ANSI_REDUCE.get(c, _ANSI_IGNORED)
+            if mapped is not _ANSI_IGNORED:
+                current_color = mapped
+                break
         last_pos = end
         
     if last_pos < len(text):
@@ -69,113 +106,393 @@ def parse_ansi(text: str):
         
     return segments
 
-def poll_log_queue_colored(text_widget):
+_last_drain = 0.0
+
+def _drain_log(text_widget, min_interval: float = 0.016):
     """
-    Checks the log queue and inserts each message into text_widget,
-    parsing ANSI codes to display colors.
+    Drains the log ring buffer and inserts the pending messages into
+    text_widget in batches, parsing ANSI codes to display colors. Calls
+    arriving faster than 'min_interval' are skipped so bursty logs cannot
+    overwhelm Tk; the fallback poll picks those messages up.
     """
-    real_text_widget = getattr(text_widget, "_textbox", text_widget)
-    try:
-        while True:
-            message = log_queue.get_nowait()
+    global log_buffer, _last_drain
+    now = time.monotonic()
+    if now - _last_drain < min_interval:
+        return
+    _last_drain = now
+    with log_buffer_lock:
+        messages, log_buffer = log_buffer, collections.deque(maxlen=LOG_BUFFER_SIZE)
+    if messages:
+        real_text_widget = getattr(text_widget, "_textbox", text_widget)
+        # Merge consecutive segments sharing a color tag so Tk performs one
+        # large insert per run instead of one per message.
+        runs = []
+        for message in messages:
             for segment, color_tag in parse_ansi(message + "\n"):
-                if color_tag:
-                    real_text_widget.insert("end", segment, color_tag)
+                if runs and runs[-1][0] == color_tag:
+                    runs[-1][1].append(segment)
                 else:
-                    real_text_widget.insert("end", segment)
-            real_text_widget.see("end")
-    except queue.Empty:
-        pass
+                    runs.append((color_tag, [segment]))
+        for color_tag, segments in runs:
+            if color_tag:
+                real_text_widget.insert("end", "".join(segments), color_tag)
+            else:
+                real_text_widget.insert("end", "".join(segments))
+        # Trim the oldest lines back to the cap in one call, so insert
+        # latency stays flat on long Shipping builds no matter how many
+        # lines a single drain inserted.
+        total_lines = int(real_text_widget.index("end-1c").split(".")[0])
+        if total_lines > MAX_LOG_LINES:
+            real_text_widget.delete("1.0", f"{total_lines - MAX_LOG_LINES + 1}.0")
+        real_text_widget.see("end")
+
+def poll_log_queue_colored(text_widget):
+    """100 ms fallback drain; bursts are drained early via <<LogAvailable>>."""
+    _drain_log(text_widget, min_interval=0.0)
     text_widget.after(100, poll_log_queue_colored, text_widget)
 
 ###############################################################################
 # Running Commands in Real-Time (Streaming)
 ###############################################################################
-def run_command_stream(command: str, status_var: ctk.StringVar, start_message: str, finish_message: str):
+# Child process currently streamed by run_command_stream; the window-close
+# handler kills it so exiting the GUI never leaves a build running.
+_active_process = None
+
+def run_command_stream(command: list, post_status, start_message: str, finish_message: str):
     """
-    Executes 'command' with Popen, reading stdout line by line and sending it
-    to the log in real time.
+    Executes the 'command' argv list with Popen, pumping stdout in 64 KB
+    binary chunks and forwarding the completed lines to the log in real time.
+    'post_status' is a thread-safe callable that displays a status message.
     """
-    status_var.set(start_message)
+    global _active_process
+    post_status(start_message)
     log(start_message)
     try:
+        # Passing the argv list directly (no shell=True) skips the cmd.exe
+        # middleman and its extra pipe hop, and makes quoting unnecessary.
         process = subprocess.Popen(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
+            creationflags=subprocess.CREATE_NO_WINDOW
         )
-        for line in iter(process.stdout.readline, ""):
-            if line:
-                log(line.rstrip("\n"))
+        _active_process = process
+        # Reading the pipe in large chunks and splitting on the last newline
+        # replaces one Python readline call (and one log append) per line
+        # with one of each per chunk, which matters on verbose UBT output.
+        # readinto refills a single reusable buffer, so no fresh bytes object
+        # is allocated per read.
+        raw_stdout = process.stdout.raw
+        read_buffer = bytearray(65536)
+        read_view = memoryview(read_buffer)
+        leftover = b""
+        while True:
+            count = raw_stdout.readinto(read_view)
+            if not count:
+                break
+            lines, newline, leftover = (leftover + bytes(read_view[:count])).rpartition(b'\n')
+            if newline:
+                # The binary pump skips universal-newline translation, so
+                # drop the \r of CRLF output here (one C-level pass per chunk).
+                log(lines.decode('utf-8', 'replace').replace('\r', ''))
+        if leftover:
+            log(leftover.decode('utf-8', 'replace').replace('\r', ''))
         process.stdout.close()
         process.wait()
         retcode = process.returncode
         if retcode == 0:
-            status_var.set("Done")
+            post_status("Done")
             log(finish_message)
         else:
-            status_var.set("Error")
+            post_status("Error")
             log(f"Error: command returned exit code {retcode}")
     except Exception as e:
         log(f"Error: {e}")
-        status_var.set("Error")
+        post_status("Error")
+    finally:
+        _active_process = None
 
 ###############################################################################
 # Utility Functions for Cleanup and Engine Path Lookup
 ###############################################################################
+@functools.lru_cache(maxsize=8)
 def find_unreal_engine_path_from_registry(version: str):
     registry_path = rf"SOFTWARE\EpicGames\Unreal Engine\{version}"
     try:
-        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_path, 0, winreg.KEY_READ)
-        installed_directory, _ = winreg.QueryValueEx(key, "InstalledDirectory")
-        winreg.CloseKey(key)
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, registry_path, 0, winreg.KEY_READ) as key:
+            installed_directory, _ = winreg.QueryValueEx(key, "InstalledDirectory")
         if installed_directory and os.path.exists(installed_directory):
             return installed_directory
-        else:
-            log(f"Unreal Engine {version} found, but directory '{installed_directory}' does not exist.")
-            return None
+        log(f"Unreal Engine {version} found, but directory '{installed_directory}' does not exist.")
+        return None
     except FileNotFoundError:
         log(f"Unreal Engine {version} not found in Windows registry.")
         return None
 
+@functools.lru_cache(maxsize=4)
+def _resolve_engine(version: str):
+    """
+    Resolves the Unreal Engine install path for 'version': environment
+    variable first, then the Windows registry, then the default Epic Games
+    install location. Cached so Compile and Build (UAT) share one lookup.
+    """
+    unreal_engine_path = os.environ.get("UNREAL_ENGINE_PATH")
+    if unreal_engine_path:
+        log(f"Path defined by environment variable: {unreal_engine_path}")
+        return unreal_engine_path
+    unreal_engine_path = find_unreal_engine_path_from_registry(version)
+    if unreal_engine_path:
+        log(f"Path obtained from registry: {unreal_engine_path}")
+        return unreal_engine_path
+    unreal_engine_path = rf"C:\Program Files\Epic Games\UE_{version}"
+    log(f"Using default path: {unreal_engine_path}")
+    return unreal_engine_path
+
+@functools.lru_cache(maxsize=4)
+def _load_uproject_data(uproject_path: str, mtime_ns: int):
+    with open(uproject_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _load_uproject(uproject_path: str):
+    """Parses the .uproject JSON, cached until the file's mtime changes."""
+    return _load_uproject_data(uproject_path, os.stat(uproject_path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=4)
+def _find_uproject_cached(cwd: str, mtime_ns: int):
+    found = None
+    with os.scandir(cwd) as entries:
+        for entry in entries:
+            if entry.name.endswith(".uproject") and entry.is_file():
+                if found is not None:
+                    log(f"More than one .uproject file found. Selecting {os.path.basename(found)}.")
+                    break
+                found = entry.path
+    return found
+
+def _find_uproject(cwd: str):
+    """
+    Returns the path of the first .uproject in 'cwd', or None, warning when
+    several are present. A single scandir pass instead of a full glob over
+    the directory; cached until the directory's mtime changes.
+    """
+    return _find_uproject_cached(cwd, os.stat(cwd).st_mtime_ns)
+
+def _open_with_shell(path: str):
+    """
+    Asks the Windows shell to open 'path' without blocking the caller.
+    Unlike os.startfile, the detached 'start' launch returns immediately even
+    when the associated application (e.g., a cold Visual Studio) takes seconds
+    to resolve, so the build thread can finish right away.
+    """
+    try:
+        subprocess.Popen(
+            ["cmd", "/c", "start", "", path],
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    except OSError as e:
+        log(f"Error opening {path}: {e}")
+
+def _fast_rmtree(path: str) -> bool:
+    """
+    Removes a directory tree with the platform's native delete command.
+    A single 'rd /s /q' (Windows) or 'rm -rf' (POSIX) subprocess is much faster
+    than shutil.rmtree on the huge Intermediate/DerivedDataCache trees Unreal
+    generates, since the traversal happens kernel-side instead of one Python
+    call per file. Falls back to shutil.rmtree if the command is unavailable.
+    Returns False (and logs the error) if the tree is still present afterwards,
+    e.g. because a running editor holds files in it open.
+    """
+    try:
+        if os.name == "nt":
+            subprocess.run(["cmd", "/c", "rd", "/s", "/q", path], check=False,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            subprocess.run(["rm", "-rf", path], check=False)
+    except FileNotFoundError:
+        shutil.rmtree(path, ignore_errors=True)
+    # rd can exit 0 after a partial delete, so probe the path rather than
+    # trusting the return code.
+    if os.path.isdir(path):
+        log(f"Error removing folder {path}: some items could not be deleted")
+        return False
+    return True
+
+###############################################################################
+# Raw Win32 tree deletion (fastest path on Windows)
+###############################################################################
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+_FILE_ATTRIBUTE_READONLY = 0x01
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+_FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+_FindExInfoBasic = 1
+_FindExSearchNameMatch = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+
+class _WIN32_FIND_DATAW(ctypes.Structure):
+    _fields_ = [
+        ("dwFileAttributes", wintypes.DWORD),
+        ("ftCreationTime", wintypes.FILETIME),
+        ("ftLastAccessTime", wintypes.FILETIME),
+        ("ftLastWriteTime", wintypes.FILETIME),
+        ("nFileSizeHigh", wintypes.DWORD),
+        ("nFileSizeLow", wintypes.DWORD),
+        ("dwReserved0", wintypes.DWORD),
+        ("dwReserved1", wintypes.DWORD),
+        ("cFileName", wintypes.WCHAR * 260),
+        ("cAlternateFileName", wintypes.WCHAR * 14),
+    ]
+
+if os.name == "nt":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+    _kernel32.FindFirstFileExW.argtypes = (
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p,
+        ctypes.c_int, ctypes.c_void_p, wintypes.DWORD
+    )
+    _kernel32.FindNextFileW.argtypes = (wintypes.HANDLE, ctypes.c_void_p)
+    _kernel32.FindClose.argtypes = (wintypes.HANDLE,)
+    _kernel32.DeleteFileW.argtypes = (wintypes.LPCWSTR,)
+    _kernel32.RemoveDirectoryW.argtypes = (wintypes.LPCWSTR,)
+    _kernel32.SetFileAttributesW.argtypes = (wintypes.LPCWSTR, wintypes.DWORD)
+else:
+    _kernel32 = None
+
+def _win_fast_rmtree(path: str) -> bool:
+    """
+    Deletes a tree with raw Win32 calls: FindFirstFileExW with basic info and
+    the large-fetch flag enumerates many entries per kernel round trip (and
+    skips the 8.3 alternate-name lookup), then DeleteFileW/RemoveDirectoryW
+    act on them directly. An explicit stack replaces recursion. Returns False
+    on any failure so the caller can fall back to _fast_rmtree.
+    """
+    if _kernel32 is None:
+        return False
+    find_data = _WIN32_FIND_DATAW()
+    find_ref = ctypes.byref(find_data)
+    # (directory, children_done): a directory is removed once it comes back
+    # off the stack with children_done set.
+    stack = [(path, False)]
+    while stack:
+        current, children_done = stack.pop()
+        if children_done:
+            if not _kernel32.RemoveDirectoryW(current):
+                return False
+            continue
+        stack.append((current, True))
+        handle = _kernel32.FindFirstFileExW(
+            current + "\\*", _FindExInfoBasic, find_ref,
+            _FindExSearchNameMatch, None, _FIND_FIRST_EX_LARGE_FETCH
+        )
+        if handle == _INVALID_HANDLE_VALUE:
+            return False
+        try:
+            while True:
+                name = find_data.cFileName
+                if name not in (".", ".."):
+                    child = current + "\\" + name
+                    attrs = find_data.dwFileAttributes
+                    if attrs & _FILE_ATTRIBUTE_READONLY:
+                        _kernel32.SetFileAttributesW(child, attrs & ~_FILE_ATTRIBUTE_READONLY)
+                    if attrs & _FILE_ATTRIBUTE_DIRECTORY:
+                        if attrs & _FILE_ATTRIBUTE_REPARSE_POINT:
+                            # Junction/symlink: unlink it, never follow it.
+                            if not _kernel32.RemoveDirectoryW(child):
+                                return False
+                        else:
+                            stack.append((child, False))
+                    elif not _kernel32.DeleteFileW(child):
+                        return False
+                if not _kernel32.FindNextFileW(handle, find_ref):
+                    break
+        finally:
+            _kernel32.FindClose(handle)
+    return True
+
+# Per-item logging floods the GUI on big trees (one message per removal);
+# keep it off by default and emit one summary line per cleanup pass instead.
+VERBOSE_CLEAN = False
+
 def remove_items_recursively(directory, folders_to_delete, files_to_delete):
-    for folder in folders_to_delete:
-        folder_path = os.path.join(directory, folder)
-        if os.path.isdir(folder_path):
-            try:
-                shutil.rmtree(folder_path)
-                log(f"Removed folder: {folder_path}")
-            except Exception as e:
-                log(f"Error removing folder {folder_path}: {e}")
-    for file in files_to_delete:
-        file_path = os.path.join(directory, file)
-        if os.path.isfile(file_path):
-            try:
-                os.remove(file_path)
-                log(f"Removed file: {file_path}")
-            except Exception as e:
-                log(f"Error removing file {file_path}: {e}")
-    for entry in os.listdir(directory):
-        entry_path = os.path.join(directory, entry)
-        if os.path.isdir(entry_path):
-            remove_items_recursively(entry_path, folders_to_delete, files_to_delete)
+    # Build the membership sets once; the recursion below only passes them on.
+    folders, files = _remove_matches(directory, frozenset(folders_to_delete), frozenset(files_to_delete))
+    log(f"Cleaned {directory}: {folders} folder(s), {files} file(s) removed")
 
-def clean_plugins_folder(script_directory: str, project_name: str):
+def _remove_matches(directory, folder_set: frozenset, file_set: frozenset):
+    """
+    Single os.scandir pass per directory: each entry carries its file type
+    from the directory read, so no extra stat per child, and names are tested
+    against sets instead of lists. Returns (folders_removed, files_removed).
+    """
+    removed_folders = 0
+    removed_files = 0
+    try:
+        entries = os.scandir(directory)
+    except OSError as e:
+        log(f"Error scanning {directory}: {e}")
+        return removed_folders, removed_files
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in folder_set:
+                    try:
+                        if _win_fast_rmtree(entry.path) or _fast_rmtree(entry.path):
+                            removed_folders += 1
+                            if VERBOSE_CLEAN:
+                                log(f"Removed folder: {entry.path}")
+                    except Exception as e:
+                        log(f"Error removing folder {entry.path}: {e}")
+                else:
+                    sub_folders, sub_files = _remove_matches(entry.path, folder_set, file_set)
+                    removed_folders += sub_folders
+                    removed_files += sub_files
+            elif entry.name in file_set:
+                try:
+                    os.remove(entry.path)
+                    removed_files += 1
+                    if VERBOSE_CLEAN:
+                        log(f"Removed file: {entry.path}")
+                except Exception as e:
+                    log(f"Error removing file {entry.path}: {e}")
+    return removed_folders, removed_files
+
+def clean_plugins_folder(script_directory: str, project_name: str, executor=None):
+    """
+    Submits one cleanup task per plugin to 'executor' and returns a dict of
+    future -> plugin path. Without an executor, cleans sequentially.
+    """
     plugins_directory = os.path.join(script_directory, "Plugins")
     if not os.path.isdir(plugins_directory):
         log(f"Plugins folder not found in {script_directory}.")
-        return
+        return {}
     log("Cleaning plugin folders and files...")
-    folders_to_delete = [".vs", "Binaries", "DerivedDataCache", "Intermediate", "Saved"]
-    files_to_delete = [f"{project_name}.sln", ".vsconfig"]
-    remove_items_recursively(plugins_directory, folders_to_delete, files_to_delete)
+    folder_set = frozenset([".vs", "Binaries", "DerivedDataCache", "Intermediate", "Saved"])
+    file_set = frozenset([f"{project_name}.sln", ".vsconfig"])
+    if executor is None:
+        remove_items_recursively(plugins_directory, folder_set, file_set)
+        return {}
+    futures = {}
+    # Mirror what _remove_matches does one level down: entries of Plugins/
+    # itself are matched against the delete sets, and only non-matching
+    # directories get a recursive cleanup task.
+    with os.scandir(plugins_directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in folder_set:
+                    futures[executor.submit(_fast_rmtree, entry.path)] = entry.path
+                else:
+                    futures[executor.submit(_remove_matches, entry.path, folder_set, file_set)] = entry.path
+            elif entry.name in file_set:
+                try:
+                    os.remove(entry.path)
+                    if VERBOSE_CLEAN:
+                        log(f"Removed file: {entry.path}")
+                except Exception as e:
+                    log(f"Error removing file {entry.path}: {e}")
+    return futures
 
 def clean_files_and_folders(script_directory: str, project_name: str):
     log("Cleaning project root folders...")
-    folders_to_delete = [
+    root_folders = [
         os.path.join(script_directory, ".vs"),
         os.path.join(script_directory, ".idea"),
         os.path.join(script_directory, "Binaries"),
@@ -183,17 +500,30 @@ def clean_files_and_folders(script_directory: str, project_name: str):
         os.path.join(script_directory, "Intermediate"),
         os.path.join(script_directory, "Saved")
     ]
-    for folder in folders_to_delete:
-        if os.path.isdir(folder):
+    # The root folders live on independent subtrees and the work is almost
+    # entirely kernel/filesystem time, so overlapping the deletions pays off.
+    max_workers = min(8, (os.cpu_count() or 4) * 2)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for folder in root_folders:
+            if os.path.isdir(folder):
+                futures[executor.submit(_fast_rmtree, folder)] = folder
+        futures.update(clean_plugins_folder(script_directory, project_name, executor))
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
             try:
-                shutil.rmtree(folder)
-                log(f"Removed folder: {folder}")
+                result = future.result()
             except Exception as e:
-                log(f"Error removing folder {folder}: {e}")
+                log(f"Error cleaning {path}: {e}")
+                continue
+            if isinstance(result, tuple):
+                log(f"Cleaned {path}: {result[0]} folder(s), {result[1]} file(s) removed")
+            elif result:
+                log(f"Removed folder: {path}")
+            # On False, _fast_rmtree already logged the failure.
     log("Cleaning project root files...")
-    uproject_list = glob.glob("*.uproject")
-    if uproject_list:
-        project_file = uproject_list[0]
+    project_file = _find_uproject(script_directory)
+    if project_file:
         project_name_local = os.path.splitext(os.path.basename(project_file))[0]
         files_to_delete = [
             os.path.join(script_directory, f"{project_name_local}.sln"),
@@ -206,13 +536,12 @@ def clean_files_and_folders(script_directory: str, project_name: str):
                     log(f"Removed file: {file}")
                 except Exception as e:
                     log(f"Error removing file {file}: {e}")
-    clean_plugins_folder(script_directory, project_name)
     log("Cleanup completed successfully!")
 
 ###############################################################################
 # Build Process (Compile the Editor)
 ###############################################################################
-def run_build_process(open_sln: bool, open_uproject: bool, status_var: ctk.StringVar):
+def run_build_process(open_sln: bool, open_uproject: bool, post_status):
     """
     Compiles the Editor project via dotnet + UnrealBuildTool.
     Reads the .uproject file to determine the engine version, cleans the project,
@@ -220,17 +549,13 @@ def run_build_process(open_sln: bool, open_uproject: bool, status_var: ctk.Strin
     """
     try:
         script_directory = os.getcwd()
-        uproject_files = glob.glob("*.uproject")
-        if not uproject_files:
+        uproject_path = _find_uproject(script_directory)
+        if not uproject_path:
             log("No .uproject file found in the current directory.")
             return
-        if len(uproject_files) > 1:
-            log("More than one .uproject file found. Selecting the first one.")
-        uproject_path = os.path.abspath(uproject_files[0])
         log(f".uproject file found: {uproject_path}")
 
-        with open(uproject_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+        project_data = _load_uproject(uproject_path)
         engine_version = project_data.get("EngineAssociation")
         if not engine_version:
             log("'EngineAssociation' key not found in the .uproject file.")
@@ -241,16 +566,7 @@ def run_build_process(open_sln: bool, open_uproject: bool, status_var: ctk.Strin
         target_name = f"{project_name}Editor"
         log(f"Target to compile: {target_name}")
 
-        unreal_engine_path = os.environ.get("UNREAL_ENGINE_PATH")
-        if not unreal_engine_path:
-            unreal_engine_path = find_unreal_engine_path_from_registry(engine_version)
-            if not unreal_engine_path:
-                unreal_engine_path = rf"C:\Program Files\Epic Games\UE_{engine_version}"
-                log(f"Using default path: {unreal_engine_path}")
-            else:
-                log(f"Path obtained from registry: {unreal_engine_path}")
-        else:
-            log(f"Path defined by environment variable: {unreal_engine_path}")
+        unreal_engine_path = _resolve_engine(engine_version)
 
         build_tool_dll = os.path.join(
             unreal_engine_path,
@@ -266,39 +582,48 @@ def run_build_process(open_sln: bool, open_uproject: bool, status_var: ctk.Strin
 
         platform_str = "Win64"
         configuration = "Development"
-        compile_command = (
-            f'dotnet "{build_tool_dll}" {target_name} {platform_str} {configuration} '
-            f'-Project="{uproject_path}" -WaitMutex -FromMsBuild -Rebuild'
-        )
+        compile_command = [
+            "dotnet", build_tool_dll, target_name, platform_str, configuration,
+            f"-Project={uproject_path}", "-WaitMutex", "-FromMsBuild", "-Rebuild"
+        ]
 
         log("\n=== Cleaning project files for rebuild ===")
-        clean_files_and_folders(script_directory, project_name)
+        generated_dirs = ("Intermediate", "Binaries", "DerivedDataCache", "Saved")
+        if (any(os.path.isdir(os.path.join(script_directory, d)) for d in generated_dirs)
+                or os.path.isfile(os.path.join(script_directory, f"{project_name}.sln"))):
+            clean_files_and_folders(script_directory, project_name)
+        else:
+            # Fresh checkout or a Clean just ran: no generated trees and no
+            # solution file, so the whole cleanup pass would be a no-op walk.
+            log("Nothing to clean - skipping")
 
         build_script_path = os.path.join(unreal_engine_path, "Engine", "Build", "BatchFiles", "Build.bat")
         if not os.path.exists(build_script_path):
             log(f"Build.bat file not found at: {build_script_path}")
             return
-        build_command = f'"{build_script_path}" -projectfiles -project="{uproject_path}" -game -rocket'
+        build_command = [
+            build_script_path, "-projectfiles", f"-project={uproject_path}", "-game", "-rocket"
+        ]
         log("\n=== Recreating SLN file (calling Build.bat) ===")
-        log(f"Executing: {build_command}")
-        run_command_stream(build_command, status_var, "Recreating SLN", "SLN file recreated successfully")
+        log(f"Executing: {subprocess.list2cmdline(build_command)}")
+        run_command_stream(build_command, post_status, "Recreating SLN", "SLN file recreated successfully")
 
         log("\n=== Compiling the project ===")
-        log(f"Executing: {compile_command}")
-        run_command_stream(compile_command, status_var, "Compiling project", "Project compiled successfully")
+        log(f"Executing: {subprocess.list2cmdline(compile_command)}")
+        run_command_stream(compile_command, post_status, "Compiling project", "Project compiled successfully")
         log("\nProject files compiled successfully.")
 
         if open_sln:
             sln_path = os.path.join(script_directory, f"{project_name}.sln")
             if os.path.isfile(sln_path):
                 log("Opening SLN file...")
-                os.startfile(sln_path)
+                _open_with_shell(sln_path)
             else:
                 log("SLN file not found to open.")
         if open_uproject:
             if os.path.isfile(uproject_path):
                 log("Opening .uproject file...")
-                os.startfile(uproject_path)
+                _open_with_shell(uproject_path)
             else:
                 log(".uproject file not found to open.")
     except Exception as e:
@@ -307,24 +632,20 @@ def run_build_process(open_sln: bool, open_uproject: bool, status_var: ctk.Strin
 ###############################################################################
 # UAT Build Process (Packaging)
 ###############################################################################
-def run_UAT_build_process(status_var: ctk.StringVar, build_path: str, build_config: str):
+def run_UAT_build_process(post_status, build_path: str, build_config: str):
     """
     Executes BuildCookRun via RunUAT.bat for packaging.
     Builds, cooks, and packages the project.
     """
     try:
         script_directory = os.getcwd()
-        uproject_files = glob.glob("*.uproject")
-        if not uproject_files:
+        uproject_path = _find_uproject(script_directory)
+        if not uproject_path:
             log("No .uproject file found in the current directory.")
             return
-        if len(uproject_files) > 1:
-            log("More than one .uproject file found. Selecting the first one.")
-        uproject_path = os.path.abspath(uproject_files[0])
         log(f".uproject file found: {uproject_path}")
 
-        with open(uproject_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+        project_data = _load_uproject(uproject_path)
         engine_version = project_data.get("EngineAssociation")
         if not engine_version:
             log("'EngineAssociation' key not found in the .uproject file.")
@@ -335,61 +656,53 @@ def run_UAT_build_process(status_var: ctk.StringVar, build_path: str, build_conf
         target = project_name
         log(f"Target to be built: {target}")
 
-        unreal_engine_path = os.environ.get("UNREAL_ENGINE_PATH")
-        if not unreal_engine_path:
-            unreal_engine_path = find_unreal_engine_path_from_registry(engine_version)
-            if not unreal_engine_path:
-                unreal_engine_path = rf"C:\Program Files\Epic Games\UE_{engine_version}"
-                log(f"Using default path: {unreal_engine_path}")
-            else:
-                log(f"Path obtained from registry: {unreal_engine_path}")
-        else:
-            log(f"Path defined by environment variable: {unreal_engine_path}")
+        unreal_engine_path = _resolve_engine(engine_version)
 
         runUAT_path = os.path.join(unreal_engine_path, "Engine", "Build", "BatchFiles", "RunUAT.bat")
         if not os.path.exists(runUAT_path):
             log(f"RunUAT.bat file not found at: {runUAT_path}")
             return
 
-        command = (
-            f'"{runUAT_path}" '
-            f'-ScriptsForProject="{uproject_path}" '
-            f'Turnkey '
-            f'-command=VerifySdk '
-            f'-platform=Win64 '
-            f'-UpdateIfNeeded '
-            f'-EditorIO '
-            f'-EditorIOPort=52904 '
-            f'-project="{uproject_path}" '
-            f'BuildCookRun '
-            f'-nop4 '
-            f'-utf8output '
-            f'-nocompileeditor '
-            f'-skipbuildeditor '
-            f'-cook '
-            f'-project="{uproject_path}" '
-            f'-target={target} '
-            f'-unrealexe="{os.path.join(unreal_engine_path, "Engine", "Binaries", "Win64", "UnrealEditor-Cmd.exe")}" '
-            f'-platform=Win64 '
-            f'-installed '
-            f'-stage '
-            f'-archive '
-            f'-package '
-            f'-build '
-            f'-pak '
-            f'-compressed '
-            f'-prereqs '
-            f'-archivedirectory="{build_path}" '
-            f'-clientconfig={build_config} '
-            f'-nocompile '
-            f'-nocompileuat'
-        )
+        unreal_exe = os.path.join(unreal_engine_path, "Engine", "Binaries", "Win64", "UnrealEditor-Cmd.exe")
+        command = [
+            runUAT_path,
+            f"-ScriptsForProject={uproject_path}",
+            "Turnkey",
+            "-command=VerifySdk",
+            "-platform=Win64",
+            "-UpdateIfNeeded",
+            "-EditorIO",
+            "-EditorIOPort=52904",
+            f"-project={uproject_path}",
+            "BuildCookRun",
+            "-nop4",
+            "-utf8output",
+            "-nocompileeditor",
+            "-skipbuildeditor",
+            "-cook",
+            f"-project={uproject_path}",
+            f"-target={target}",
+            f"-unrealexe={unreal_exe}",
+            "-platform=Win64",
+            "-installed",
+            "-stage",
+            "-archive",
+            "-package",
+            "-build",
+            "-pak",
+            "-compressed",
+            "-prereqs",
+            f"-archivedirectory={build_path}",
+            f"-clientconfig={build_config}",
+            "-nocompile",
+            "-nocompileuat"
+        ]
         log("Executing UAT command:")
-        log(command)
-        run_command_stream(command, status_var, "Starting Build UAT...", "UAT Build completed successfully!")
+        log(subprocess.list2cmdline(command))
+        run_command_stream(command, post_status, "Starting Build UAT...", "UAT Build completed successfully!")
     except Exception as e:
         log(f"Error in Build UAT: {e}")
-        status_var.set("Error in Build UAT")
+        post_status("Error in Build UAT")
 
 ###############################################################################
 # CustomTkinter UI (with Checkboxes and Radiobuttons)
@@ -402,6 +715,15 @@ class MobileStyleApp(ctk.CTk):
         
         self.title("Unreal Build Tool - Dark Mobile Style")
         self.geometry("500x600")
+
+        # Shared worker pool: no fresh OS thread per click, and a second
+        # click while a job runs simply queues behind it.
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="uebuild"
+        )
+        # Pool workers are non-daemon; without this, closing the window
+        # mid-build would leave the process alive until the build finishes.
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.tabview = ctk.CTkTabview(self, corner_radius=0, width=500, height=600)
         self.tabview.pack(fill="both", expand=True)
@@ -454,6 +776,13 @@ class MobileStyleApp(ctk.CTk):
         # Configure ANSI color tags in the internal tk.Text widget if needed
         self.configure_ansi_tags(self.build_log_text)
         
+        # Event-driven log drain: log() wakes the GUI immediately instead of
+        # waiting out the polling interval. The 100 ms poll stays as fallback.
+        global _log_event_widget
+        real_log_widget = getattr(self.build_log_text, "_textbox", self.build_log_text)
+        real_log_widget.bind("<<LogAvailable>>", lambda event: _drain_log(self.build_log_text))
+        _log_event_widget = real_log_widget
+
         # Start polling for colored logs
         self.build_log_text.after(100, poll_log_queue_colored, self.build_log_text)
         
@@ -474,22 +803,55 @@ class MobileStyleApp(ctk.CTk):
     def start_compile_thread(self):
         self.compile_btn.configure(state="disabled")
         self.status_var.set("Compiling Editor...")
-        threading.Thread(target=self.run_compile, daemon=True).start()
-        
+        future = self._pool.submit(self.run_compile)
+        # Re-enable the button on the Tk thread once the worker finishes.
+        future.add_done_callback(
+            lambda f: self.after(0, lambda: self.compile_btn.configure(state="normal"))
+        )
+
+    def _on_close(self):
+        """Kills any running build and exits without waiting on pool workers."""
+        global _log_file
+        process = _active_process
+        if process is not None and process.poll() is None:
+            try:
+                process.kill()
+            except OSError:
+                pass
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        # os._exit skips interpreter cleanup, so flush build.log here or the
+        # buffered tail (usually the final build outcome) is lost.
+        with log_buffer_lock:
+            if _log_file is not None:
+                try:
+                    _log_file.close()
+                except OSError:
+                    pass
+                _log_file = None
+        self.destroy()
+        # Skip concurrent.futures' atexit join of the worker threads, which
+        # would otherwise block interpreter shutdown on a busy worker.
+        os._exit(0)
+
+    def _post_status(self, message: str):
+        """Marshals a status update from any thread onto the Tk main loop."""
+        self.after(0, lambda: self.status_var.set(message))
+
     def run_compile(self):
-        run_build_process(self.open_sln.get(), self.open_uproject.get(), self.status_var)
-        self.compile_btn.configure(state="normal")
-        
+        run_build_process(self.open_sln.get(), self.open_uproject.get(), self._post_status)
+
     def start_package_thread(self):
         self.package_btn.configure(state="disabled")
         self.status_var.set("Starting Build UAT...")
         build_path = self.build_path_entry.get().strip() or os.path.join(os.getcwd(), "BuildOutput")
         build_cfg = self.build_config.get()
-        threading.Thread(target=self.run_package, args=(build_path, build_cfg), daemon=True).start()
-        
+        future = self._pool.submit(self.run_package, build_path, build_cfg)
+        future.add_done_callback(
+            lambda f: self.after(0, lambda: self.package_btn.configure(state="normal"))
+        )
+
     def run_package(self, build_path: str, build_cfg: str):
-        run_UAT_build_process(self.status_var, build_path, build_cfg)
-        self.package_btn.configure(state="normal")
+        run_UAT_build_process(self._post_status, build_path, build_cfg)
         
 if __name__ == "__main__":
     app = MobileStyleApp()